@@ -203,6 +203,30 @@ export const runDefaultAction = async (
   };
 };
 
+// Output options exposed as `--no-*` CLI flags whose option name matches the config key.
+// Applied only when explicitly false (see buildCliConfig).
+const negatedOutputFlags = ['fileSummary', 'directoryStructure', 'files'] as const;
+
+// Boolean output options whose CLI option name matches the config key, applied whenever set.
+const booleanOutputFlags = [
+  'parsableStyle',
+  'removeComments',
+  'removeEmptyLines',
+  'truncateBase64',
+  'compress',
+] as const;
+
+type OutputFlag = (typeof negatedOutputFlags)[number] | (typeof booleanOutputFlags)[number];
+
+const withOutputFlag = (
+  output: RepomixConfigCli['output'],
+  flag: OutputFlag,
+  value: boolean,
+): NonNullable<RepomixConfigCli['output']> => {
+  const override: Partial<Record<OutputFlag, boolean>> = { [flag]: value };
+  return { ...output, ...override };
+};
+
 /**
  * Builds CLI configuration from command-line options.
  *
@@ -266,12 +290,6 @@ export const buildCliConfig = (options: CliOptions): RepomixConfigCli => {
       filePathStyle: options.outputFilePathStyle.toLowerCase() as RepomixOutputFilePathStyle,
     };
   }
-  if (options.parsableStyle !== undefined) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      parsableStyle: options.parsableStyle,
-    };
-  }
   if (options.stdout) {
     cliConfig.output = {
       ...cliConfig.output,
@@ -282,52 +300,21 @@ export const buildCliConfig = (options: CliOptions): RepomixConfigCli => {
   if (options.securityCheck === false) {
     cliConfig.security = { enableSecurityCheck: options.securityCheck };
   }
-  // Only apply fileSummary setting if explicitly set to false
-  if (options.fileSummary === false) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      fileSummary: false,
-    };
-  }
-  // Only apply directoryStructure setting if explicitly set to false
-  if (options.directoryStructure === false) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      directoryStructure: false,
-    };
-  }
-  // Only apply files setting if explicitly set to false
-  if (options.files === false) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      files: false,
-    };
-  }
-  if (options.removeComments !== undefined) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      removeComments: options.removeComments,
-    };
-  }
-  if (options.removeEmptyLines !== undefined) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      removeEmptyLines: options.removeEmptyLines,
-    };
+  for (const flag of negatedOutputFlags) {
+    if (options[flag] === false) {
+      cliConfig.output = withOutputFlag(cliConfig.output, flag, false);
+    }
   }
-  if (options.truncateBase64 !== undefined) {
-    cliConfig.output = {
-      ...cliConfig.output,
-      truncateBase64: options.truncateBase64,
-    };
+  for (const flag of booleanOutputFlags) {
+    const value = options[flag];
+    if (value !== undefined) {
+      cliConfig.output = withOutputFlag(cliConfig.output, flag, value);
+    }
   }
   if (options.headerText !== undefined) {
     cliConfig.output = { ...cliConfig.output, headerText: options.headerText };
   }
 
-  if (options.compress !== undefined) {
-    cliConfig.output = { ...cliConfig.output, compress: options.compress };
-  }
   // Internal MCP-only field: whole-array override of output.patterns from the config file.
   if (options.outputPatterns !== undefined) {
     cliConfig.output = { ...cliConfig.output, patterns: options.outputPatterns };
@@ -43,6 +43,10 @@ export const runRemoteAction = async (
     );
   }
 
+  // Resolve the caller's working directory once; it is the destination for the
+  // skill directory and for every (possibly split) output file.
+  const cwd = process.cwd();
+
   let tempDirPath = await createTempDirectory();
   let result: DefaultActionRunnerResult;
   let downloadMethod: 'archive' | 'git' = 'git';
@@ -139,10 +143,10 @@ export const runRemoteAction = async (
           throw new RepomixError('--skill-output path cannot be empty');
         }
         // Non-interactive mode: use provided path directly
-        skillDir = await resolveAndPrepareSkillDir(cliOptions.skillOutput, process.cwd(), cliOptions.force ?? false);
+        skillDir = await resolveAndPrepareSkillDir(cliOptions.skillOutput, cwd, cliOptions.force ?? false);
       } else {
         // Interactive mode: prompt for skill location
-        const promptResult = await promptSkillLocation(skillName, process.cwd());
+        const promptResult = await promptSkillLocation(skillName, cwd);
         skillDir = promptResult.skillDir;
       }
     }
@@ -184,11 +188,11 @@ export const runRemoteAction = async (
     // Copy output to current directory (only for non-skill generation)
     // Skip copy for stdout mode (output goes directly to stdout)
     // For skill generation, the skill is already written directly to the target directory
-    // (either via --skill-output path or via promptSkillLocation which uses process.cwd())
+    // (either via --skill-output path or via promptSkillLocation which uses the current directory)
     if (!cliOptions.stdout && result.config.skillGenerate === undefined) {
       const outputFiles = result.packResult.outputFiles ?? [result.config.output.filePath];
       for (const outputFile of outputFiles) {
-        await copyOutputToCurrentDirectory(tempDirPath, process.cwd(), outputFile);
+        await copyOutputToCurrentDirectory(tempDirPath, cwd, outputFile);
       }
     }
 
@@ -35,10 +35,22 @@ export const reportTokenCountTree = (
   }
 
   const tree = buildTokenCountTree(filesWithTokens);
-  displayNode(tree, '', true, minTokenCount);
+
+  // Collect the tree into a single string and log it once. A large repository can
+  // produce thousands of tree lines, and logging each one separately costs a
+  // stdout write per line.
+  const lines: string[] = [];
+  displayNode(tree, '', true, minTokenCount, lines);
+  logger.log(lines.join('\n'));
 };
 
-const displayNode = (node: TokenCountTreeNode, prefix: string, isRoot: boolean, minTokenCount: number): void => {
+const displayNode = (
+  node: TokenCountTreeNode,
+  prefix: string,
+  isRoot: boolean,
+  minTokenCount: number,
+  lines: string[],
+): void => {
   // Get child directories that meet the minimum token count
   const entries = [...node.children].filter(([, child]) => child.tokenSum >= minTokenCount);
 
@@ -56,9 +68,9 @@ const displayNode = (node: TokenCountTreeNode, prefix: string, isRoot: boolean,
     const tokenInfo = pc.dim(`(${file.tokens.toLocaleString()} tokens)`);
 
     if (isRoot && prefix === '') {
-      logger.log(`${connector}${file.name} ${tokenInfo}`);
+      lines.push(`${connector}${file.name} ${tokenInfo}`);
     } else {
-      logger.log(`${prefix}${connector}${file.name} ${tokenInfo}`);
+      lines.push(`${prefix}${connector}${file.name} ${tokenInfo}`);
     }
   });
 
@@ -69,24 +81,24 @@ const displayNode = (node: TokenCountTreeNode, prefix: string, isRoot: boolean,
     const tokenInfo = pc.dim(`(${childNode.tokenSum.toLocaleString()} tokens)`);
 
     if (isRoot && prefix === '') {
-      logger.log(`${connector}${name}/ ${tokenInfo}`);
+      lines.push(`${connector}${name}/ ${tokenInfo}`);
     } else {
-      logger.log(`${prefix}${connector}${name}/ ${tokenInfo}`);
+      lines.push(`${prefix}${connector}${name}/ ${tokenInfo}`);
     }
 
     // Prepare prefix for children
     const childPrefix =
       isRoot && prefix === '' ? (isLastEntry ? '    ' : '│   ') : prefix + (isLastEntry ? '    ' : '│   ');
 
-    displayNode(childNode, childPrefix, false, minTokenCount);
+    displayNode(childNode, childPrefix, false, minTokenCount, lines);
   });
 
   // If this is the root and it's empty, show a message
   if (isRoot && files.length === 0 && entries.length === 0) {
     if (minTokenCount > 0) {
-      logger.log(`No files or directories found with ${minTokenCount}+ tokens.`);
+      lines.push(`No files or directories found with ${minTokenCount}+ tokens.`);
     } else {
-      logger.log('No files found.');
+      lines.push('No files found.');
     }
   }
 };
@@ -18,6 +18,9 @@ const gitRemoteOpts = { timeout: GIT_REMOTE_TIMEOUT, env: gitRemoteEnv };
 const GIT_PROBE_TIMEOUT = 5000;
 const gitProbeOpts = { timeout: GIT_PROBE_TIMEOUT, env: { ...gitRemoteEnv, GCM_INTERACTIVE: 'never' } };
 
+// Rejected by validateGitUrl
+const DANGEROUS_GIT_PARAMS = ['--upload-pack', '--receive-pack', '--config', '--exec'] as const;
+
 export const execGitLogFilenames = async (
   directory: string,
   maxCommits = 100,
@@ -222,8 +225,7 @@ export const execGitLog = async (
  */
 export const validateGitUrl = (url: string): void => {
   // Block dangerous git parameters that could be used for command injection
-  const dangerousParams = ['--upload-pack', '--receive-pack', '--config', '--exec'];
-  if (dangerousParams.some((param) => url.includes(param))) {
+  if (DANGEROUS_GIT_PARAMS.some((param) => url.includes(param))) {
     throw new RepomixError(`Invalid repository URL. URL contains potentially dangerous parameters: ${redactUrl(url)}`);
   }
 
@@ -17,6 +17,8 @@ export interface GitHubRepoInfo {
 // Re-export from lightweight module to preserve public API
 export { isValidShorthand } from './gitRemoteUrl.js';
 
+const GITHUB_HOSTS = new Set(['github.com', 'www.github.com']);
+
 /**
  * Check if a URL is an Azure DevOps repository URL by validating the hostname.
  * This uses proper URL parsing to avoid security issues with substring matching.
@@ -90,8 +92,8 @@ const parseRemoteValueInternal = (
     // This will make parsedFields.toString() automatically append '.git' to the returned url
     parsedFields.git_suffix = true;
 
-    const ownerSlashRepo =
-      parsedFields.full_name.split('/').length > 1 ? parsedFields.full_name.split('/').slice(-2).join('/') : '';
+    const fullNameParts = parsedFields.full_name.split('/');
+    const ownerSlashRepo = fullNameParts.length > 1 ? fullNameParts.slice(-2).join('/') : '';
 
     if (ownerSlashRepo !== '' && !isValidShorthand(ownerSlashRepo)) {
       throw new RepomixError('Invalid owner/repo in repo URL');
@@ -149,9 +151,7 @@ export const parseGitHubRepoInfo = (remoteValue: string): GitHubRepoInfo | null
     // For GitHub URLs with branch/tag/commit info, extract directly from URL
     try {
       const url = new URL(remoteValue);
-      const allowedHosts = ['github.com', 'www.github.com'];
-
-      if (allowedHosts.includes(url.hostname)) {
+      if (GITHUB_HOSTS.has(url.hostname)) {
         const pathParts = url.pathname.split('/').filter(Boolean);
 
         if (pathParts.length >= 2) {
@@ -43,16 +43,26 @@ export async function loadLanguage(langName: string): Promise<Language> {
 
 async function getWasmPath(langName: string): Promise<string> {
   const wasmBasePath = getWasmBasePath();
+  const wasmFileName = `tree-sitter-${langName}.wasm`;
 
-  let wasmPath: string;
-  if (wasmBasePath) {
-    // Use custom WASM path for bundled environments
-    wasmPath = path.join(wasmBasePath, `tree-sitter-${langName}.wasm`);
-  } else {
-    // Use require.resolve for standard node_modules environments
-    wasmPath = require.resolve(`@repomix/tree-sitter-wasms/out/tree-sitter-${langName}.wasm`);
+  if (!wasmBasePath) {
+    // Use require.resolve for standard node_modules environments.
+    // It already fails when the file does not exist, so no separate access() probe is needed.
+    const wasmSpecifier = `@repomix/tree-sitter-wasms/out/${wasmFileName}`;
+    try {
+      return require.resolve(wasmSpecifier);
+    } catch (error) {
+      // Only a missing file maps to "not found"; other failures (e.g. a broken install) keep their message
+      if ((error as NodeJS.ErrnoException).code === 'MODULE_NOT_FOUND') {
+        throw new Error(`WASM file not found for language ${langName}: ${wasmSpecifier}`);
+      }
+      throw error;
+    }
   }
 
+  // Use custom WASM path for bundled environments
+  const wasmPath = path.join(wasmBasePath, wasmFileName);
+
   try {
     await fs.access(wasmPath);
     return wasmPath;
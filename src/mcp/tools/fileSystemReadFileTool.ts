@@ -70,17 +70,21 @@ export const registerFileSystemReadFileTool = (
 
         logger.trace(`Reading file at path: ${displayPath}`);
 
-        // Check if file exists
-        try {
-          await fs.access(absPath);
-        } catch {
+        // A single stat checks existence, tells files from directories, and carries
+        // the size below. A missing path is reported as not found; any other stat
+        // failure falls through to the generic error handling.
+        const stats = await fs.stat(absPath).catch((error: NodeJS.ErrnoException) => {
+          if (error?.code === 'ENOENT' || error?.code === 'ENOTDIR') {
+            return null;
+          }
+          throw error;
+        });
+        if (!stats) {
           return buildMcpToolErrorResponse({
             errorMessage: `Error: File not found at path: ${displayPath}`,
           });
         }
 
-        // Check if it's a directory (the same stat also carries the size below)
-        const stats = await fs.stat(absPath);
         if (stats.isDirectory()) {
           return buildMcpToolErrorResponse({
             errorMessage: `Error: The specified path is a directory, not a file: ${displayPath}. Use file_system_read_directory for directories.`,
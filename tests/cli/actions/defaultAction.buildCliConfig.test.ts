@@ -25,6 +25,64 @@ describe('buildCliConfig', () => {
     });
   });
 
+  describe('--no-* output flags', () => {
+    it('should map explicitly disabled flags into config', () => {
+      const options: CliOptions = {
+        fileSummary: false,
+        directoryStructure: false,
+        files: false,
+      };
+
+      const result = buildCliConfig(options);
+
+      expect(result.output).toEqual({
+        fileSummary: false,
+        directoryStructure: false,
+        files: false,
+      });
+    });
+
+    it('should not override config when flags keep their commander default', () => {
+      const options: CliOptions = {
+        fileSummary: true,
+        directoryStructure: true,
+        files: true,
+      };
+
+      const result = buildCliConfig(options);
+
+      expect(result.output).toBeUndefined();
+    });
+  });
+
+  describe('boolean output flags', () => {
+    it('should map set flags into config, including explicit false', () => {
+      const options: CliOptions = {
+        parsableStyle: true,
+        removeComments: false,
+        removeEmptyLines: true,
+        truncateBase64: true,
+        compress: false,
+      };
+
+      const result = buildCliConfig(options);
+
+      expect(result.output).toEqual({
+        parsableStyle: true,
+        removeComments: false,
+        removeEmptyLines: true,
+        truncateBase64: true,
+        compress: false,
+      });
+    });
+
+    it('should leave unset flags out of the config', () => {
+      const result = buildCliConfig({ compress: true });
+
+      expect(result.output).toEqual({ compress: true });
+    });
+  });
+
   describe('splitOutput option', () => {
     it('should map splitOutput (bytes) into config', () => {
       const options: CliOptions = {
@@ -141,4 +141,36 @@ describe('reportTokenCountTree', () => {
     expect(calls.some((call) => call.includes('file2.js'))).toBe(true);
     expect(calls.some((call) => call.includes('file3.js'))).toBe(false); // Should be skipped
   });
+
+  test('should log the whole tree in a single call', () => {
+    const processedFiles: ProcessedFile[] = [
+      { path: 'src/file1.js', content: 'const a = 1;' },
+      { path: 'src/nested/file2.js', content: 'function test() {}' },
+      { path: 'README.md', content: '# readme' },
+    ];
+
+    const fileTokenCounts = {
+      'src/file1.js': 5,
+      'src/nested/file2.js': 7,
+      'README.md': 3,
+    };
+
+    const config = {
+      output: { tokenCountTree: true },
+    } as RepomixConfigMerged;
+
+    reportTokenCountTree(processedFiles, fileTokenCounts, config);
+
+    const treeCalls = mockLogger.mock.calls
+      .map((call: unknown[]) => call[0] as string)
+      .filter((call) => call.includes('tokens)'));
+    expect(treeCalls).toHaveLength(1);
+    expect(treeCalls[0].split('\n')).toEqual([
+      '├── README.md DIM:(3 tokens)',
+      '└── src/ DIM:(12 tokens)',
+      '    ├── file1.js DIM:(5 tokens)',
+      '    └── nested/ DIM:(7 tokens)',
+      '        └── file2.js DIM:(7 tokens)',
+    ]);
+  });
 });
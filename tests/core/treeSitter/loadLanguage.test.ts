@@ -1,8 +1,13 @@
 import fs from 'node:fs/promises';
-import { describe, expect, it, vi } from 'vitest';
+import path from 'node:path';
+import { afterEach, beforeEach, describe, expect, it, vi } from 'vitest';
 import { Language } from 'web-tree-sitter';
 import { loadLanguage } from '../../../src/core/treeSitter/loadLanguage.js';
 
+const { mockResolve } = vi.hoisted(() => ({
+  mockResolve: vi.fn((specifier: string) => `/mock/path/${specifier}`),
+}));
+
 vi.mock('node:fs/promises');
 vi.mock('web-tree-sitter', () => ({
   Language: {
@@ -11,43 +16,85 @@ vi.mock('web-tree-sitter', () => ({
 }));
 vi.mock('node:module', () => ({
   createRequire: () => ({
-    resolve: (path: string) => `/mock/path/${path}`,
+    resolve: mockResolve,
   }),
 }));
 
 describe('loadLanguage', () => {
+  beforeEach(() => {
+    vi.clearAllMocks();
+  });
+
+  afterEach(() => {
+    vi.unstubAllEnvs();
+  });
+
   it('should throw error for empty language name', async () => {
     await expect(loadLanguage('')).rejects.toThrow('Invalid language name');
   });
 
   it('should load language successfully', async () => {
     const mockAccess = vi.mocked(fs.access);
-    mockAccess.mockResolvedValue(undefined);
 
     const mockLoadLanguage = vi.fn().mockResolvedValue({ success: true });
     Language.load = mockLoadLanguage;
 
     await loadLanguage('javascript');
 
-    expect(mockAccess).toHaveBeenCalledWith('/mock/path/@repomix/tree-sitter-wasms/out/tree-sitter-javascript.wasm');
+    // require.resolve already verifies the file exists, so no extra access() probe is made
+    expect(mockAccess).not.toHaveBeenCalled();
     expect(mockLoadLanguage).toHaveBeenCalledWith(
       '/mock/path/@repomix/tree-sitter-wasms/out/tree-sitter-javascript.wasm',
     );
   });
 
   it('should throw error when WASM file is not found', async () => {
-    const mockAccess = vi.mocked(fs.access);
-    mockAccess.mockRejectedValue(new Error('File not found'));
+    mockResolve.mockImplementationOnce(() => {
+      throw Object.assign(new Error('Cannot find module'), { code: 'MODULE_NOT_FOUND' });
+    });
 
     await expect(loadLanguage('javascript')).rejects.toThrow(
-      'WASM file not found for language javascript: /mock/path/@repomix/tree-sitter-wasms/out/tree-sitter-javascript.wasm',
+      'WASM file not found for language javascript: @repomix/tree-sitter-wasms/out/tree-sitter-javascript.wasm',
     );
   });
 
-  it('should handle language load error', async () => {
+  it('should keep the original message for other resolution failures', async () => {
+    mockResolve.mockImplementationOnce(() => {
+      throw Object.assign(new Error('Package subpath is not defined by "exports"'), {
+        code: 'ERR_PACKAGE_PATH_NOT_EXPORTED',
+      });
+    });
+
+    await expect(loadLanguage('javascript')).rejects.toThrow(
+      'Failed to load language javascript: Package subpath is not defined by "exports"',
+    );
+  });
+
+  it('should check the file exists when loading from a custom WASM directory', async () => {
+    vi.stubEnv('REPOMIX_WASM_DIR', '/custom/wasm');
+    const wasmPath = path.join('/custom/wasm', 'tree-sitter-javascript.wasm');
     const mockAccess = vi.mocked(fs.access);
-    mockAccess.mockResolvedValue(undefined);
+    mockAccess.mockResolvedValueOnce(undefined);
 
+    const mockLoadLanguage = vi.fn().mockResolvedValue({ success: true });
+    Language.load = mockLoadLanguage;
+
+    await loadLanguage('javascript');
+
+    expect(mockAccess).toHaveBeenCalledWith(wasmPath);
+    expect(mockLoadLanguage).toHaveBeenCalledWith(wasmPath);
+  });
+
+  it('should throw error when WASM file is missing from a custom WASM directory', async () => {
+    vi.stubEnv('REPOMIX_WASM_DIR', '/custom/wasm');
+    vi.mocked(fs.access).mockRejectedValueOnce(new Error('File not found'));
+
+    await expect(loadLanguage('javascript')).rejects.toThrow(
+      `WASM file not found for language javascript: ${path.join('/custom/wasm', 'tree-sitter-javascript.wasm')}`,
+    );
+  });
+
+  it('should handle language load error', async () => {
     const mockLoadLanguage = vi.fn().mockRejectedValue(new Error('Load failed'));
     Language.load = mockLoadLanguage;
 
@@ -21,6 +21,7 @@ describe('FileSystemReadFileTool (sandboxed)', () => {
   });
 
   afterEach(async () => {
+    vi.restoreAllMocks();
     await fsp.rm(root, { recursive: true, force: true });
   });
 
@@ -43,4 +44,15 @@ describe('FileSystemReadFileTool (sandboxed)', () => {
     expect(result.isError).toBe(true);
     expect((result.content[0] as { text: string }).text).toContain('relative to workspace root');
   });
+
+  test('maps a non-ENOENT stat failure to a path-free reason', async () => {
+    vi.spyOn(fsp, 'stat').mockRejectedValueOnce(
+      Object.assign(new Error(`EACCES: permission denied, stat '${path.join(root, 'a.ts')}'`), { code: 'EACCES' }),
+    );
+
+    const result = await handler({ path: 'a.ts' });
+    expect(result.isError).toBe(true);
+    expect((result.content[0] as { text: string }).text).toContain('Error: permission denied: a.ts');
+    expect(JSON.stringify(result)).not.toContain(root);
+  });
 });
@@ -7,7 +7,6 @@ import { registerFileSystemReadFileTool } from '../../../src/mcp/tools/fileSyste
 
 vi.mock('node:fs/promises', () => ({
   default: {
-    access: vi.fn(),
     stat: vi.fn(),
     readFile: vi.fn(),
   },
@@ -64,7 +63,7 @@ describe('FileSystemReadFileTool', () => {
   test('should handle non-existent file', async () => {
     const testPath = '/non/existent/file.txt';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockRejectedValue(new Error('ENOENT'));
+    vi.mocked(fs.stat).mockRejectedValue(Object.assign(new Error('ENOENT'), { code: 'ENOENT' }));
 
     const result = await toolHandler({ path: testPath });
 
@@ -79,10 +78,51 @@ describe('FileSystemReadFileTool', () => {
     });
   });
 
+  test('should report not found when a path component is not a directory', async () => {
+    const testPath = '/test/file.txt/child.txt';
+    vi.mocked(path.isAbsolute).mockReturnValue(true);
+    vi.mocked(fs.stat).mockRejectedValue(Object.assign(new Error('ENOTDIR'), { code: 'ENOTDIR' }));
+
+    const result = await toolHandler({ path: testPath });
+
+    expect(result).toEqual({
+      isError: true,
+      content: [
+        {
+          type: 'text',
+          text: JSON.stringify({ errorMessage: `Error: File not found at path: ${testPath}` }, null, 2),
+        },
+      ],
+    });
+  });
+
+  test('should surface other stat failures as read errors', async () => {
+    const testPath = '/test/file.txt';
+    vi.mocked(path.isAbsolute).mockReturnValue(true);
+    vi.mocked(fs.stat).mockRejectedValue(
+      Object.assign(new Error(`EACCES: permission denied, stat '${testPath}'`), { code: 'EACCES' }),
+    );
+
+    const result = await toolHandler({ path: testPath });
+
+    expect(result).toEqual({
+      isError: true,
+      content: [
+        {
+          type: 'text',
+          text: JSON.stringify(
+            { errorMessage: `Error reading file: EACCES: permission denied, stat '${testPath}'` },
+            null,
+            2,
+          ),
+        },
+      ],
+    });
+  });
+
   test('should handle directory path error', async () => {
     const testPath = '/some/directory';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockResolvedValueOnce(undefined);
     vi.mocked(fs.stat).mockResolvedValueOnce({
       isDirectory: () => true,
     } as unknown as Awaited<ReturnType<typeof fs.stat>>);
@@ -110,7 +150,6 @@ describe('FileSystemReadFileTool', () => {
     const testPath = '/test/file.txt';
     const fileContent = 'Line 1\nLine 2\nLine 3';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockResolvedValueOnce(undefined);
     vi.mocked(fs.stat).mockResolvedValueOnce({
       isDirectory: () => false,
       size: 21,
@@ -142,7 +181,6 @@ describe('FileSystemReadFileTool', () => {
     const testPath = '/test/secrets.txt';
     const fileContent = 'API_KEY=secret123';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockResolvedValueOnce(undefined);
     vi.mocked(fs.stat).mockResolvedValueOnce({
       isDirectory: () => false,
       size: 17,
@@ -176,7 +214,6 @@ describe('FileSystemReadFileTool', () => {
   test('should handle general errors during file reading', async () => {
     const testPath = '/test/file.txt';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockResolvedValueOnce(undefined);
     vi.mocked(fs.stat).mockRejectedValueOnce(new Error('Disk I/O error'));
 
     const result = await toolHandler({ path: testPath });
@@ -195,7 +232,6 @@ describe('FileSystemReadFileTool', () => {
   test('should handle non-Error objects in catch block', async () => {
     const testPath = '/test/file.txt';
     vi.mocked(path.isAbsolute).mockReturnValue(true);
-    vi.mocked(fs.access).mockResolvedValueOnce(undefined);
     vi.mocked(fs.stat).mockRejectedValueOnce('string error');
 
     const result = await toolHandler({ path: testPath });